@@ -8,6 +8,7 @@
 
 # Global
 import os
+import logging
 import functools
 import warnings
 from copy import deepcopy
@@ -316,6 +317,12 @@ class SampleCollection(BaseCollection):
             self.temperature = temperature if temperature is not None else 1
         # Prepare fast numpy cache
         self._icol = {col: i for i, col in enumerate(self.columns)}
+        # Positions of each group of columns, to fill cache rows with a single assignment
+        self._icols_sampled, self._icols_derived, self._icols_minuslogprior, \
+            self._icols_chi2 = (
+                np.array([self._icol[name] for name in names], dtype=int)
+                for names in [self.sampled_params, self.derived_params,
+                              self.minuslogprior_names, self.chi2_names])
         self._cache_reset()
         # Prepare txt formatter
         self.n_float = 8
@@ -436,22 +443,23 @@ class SampleCollection(BaseCollection):
         """
         Adds the given point to the cache at the given position.
         """
-        self._cache[pos, self._icol[OutPar.weight]] = weight if weight is not None else 1
-        self._cache[pos, self._icol[OutPar.minuslogpost]] = \
+        row = self._cache[pos]
+        row[self._icol[OutPar.weight]] = weight if weight is not None else 1
+        row[self._icol[OutPar.minuslogpost]] = \
             -apply_temperature(logposterior.logpost, self.temperature)
-        for name, value in zip(self.sampled_params, values):
-            self._cache[pos, self._icol[name]] = value
+        row[self._icols_sampled] = values
         if logposterior.logpriors is not None:
-            for name, value in zip(self.minuslogprior_names, logposterior.logpriors):
-                self._cache[pos, self._icol[name]] = -value
-            self._cache[pos, self._icol[OutPar.minuslogprior]] = - logposterior.logprior
+            row[self._icols_minuslogprior] = -np.asarray(logposterior.logpriors,
+                                                         dtype=float)
+            row[self._icol[OutPar.minuslogprior]] = - logposterior.logprior
         if logposterior.loglikes is not None:
-            for name, value in zip(self.chi2_names, logposterior.loglikes):
-                self._cache[pos, self._icol[name]] = -2 * value
-            self._cache[pos, self._icol[OutPar.chi2]] = -2 * logposterior.loglike
+            # (empty if the likelihoods were not computed, e.g. null prior)
+            if len(logposterior.loglikes):
+                row[self._icols_chi2] = -2 * np.asarray(logposterior.loglikes,
+                                                        dtype=float)
+            row[self._icol[OutPar.chi2]] = -2 * logposterior.loglike
         if len(logposterior.derived):
-            for name, value in zip(self.derived_params, logposterior.derived):
-                self._cache[pos, self._icol[name]] = value
+            row[self._icols_derived] = np.asarray(logposterior.derived, dtype=float)
 
     def _cache_dump(self):
         """
@@ -858,6 +866,71 @@ class SampleCollection(BaseCollection):
             ddof=0,  # does simple mean w/o bias factor; weights are used as probabilities
             **{weight_type_kwarg: weights_cov}))
 
+    def mean_and_cov(
+            self,
+            first: Optional[int] = None,
+            last: Optional[int] = None,
+            weights: Optional[np.ndarray] = None,
+            derived: bool = False,
+            tempered: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the (weighted) mean and covariance matrix of the parameters in the chain,
+        as ``(mean, cov)``, extracting the samples and weights only once. Arguments as in
+        :func:`SampleCollection.mean` and :func:`SampleCollection.cov`.
+        """
+        if not self:
+            raise LoggedError(
+                self.log, "Collection is empty. Cannot compute mean and cov.")
+        weights_stats, _ = self._weights_for_stats(
+            first, last, weights=weights, tempered=tempered)
+        norm = np.sum(weights_stats)
+        if not len(weights_stats) or not norm:
+            raise LoggedError(
+                self.log, "No samples in range, or null total weight. "
+                          "Cannot compute mean and cov.")
+        samples = self[list(self.sampled_params) +
+                       (list(self.derived_params) if derived else [])][
+                  first:last].to_numpy(dtype=np.float64)
+        mean = np.dot(weights_stats, samples) / norm
+        deltas = samples - mean
+        # Simple mean w/o bias factor, as in cov(); weights are used as probabilities
+        cov = np.dot(deltas.T * weights_stats, deltas) / norm
+        return mean, np.atleast_2d(cov)
+
+    def confidence_bounds(
+            self,
+            limfrac: float,
+            first: Optional[int] = None,
+            last: Optional[int] = None,
+            tempered: bool = False,
+    ) -> np.ndarray:
+        """
+        Returns the lower and upper limits of the sampled parameters leaving a fraction
+        ``limfrac`` of the total weight in each tail, between `first` (default 0) and
+        `last` (default last obtained), as an array of shape ``(d, 2)``.
+
+        The limits are computed by counting samples in the tails, as
+        :func:`getdist.MCSamples.confidence` does, without kernel densities.
+
+        If ``tempered=True`` (default ``False``) returns the limits of the tempered
+        posterior ``p**(1/temperature)``.
+        """
+        weights, _ = self._weights_for_stats(first, last, tempered=tempered)
+        if not len(weights):
+            raise LoggedError(self.log, "No samples in range. Cannot compute bounds.")
+        samples = self[list(self.sampled_params)][first:last].to_numpy(dtype=np.float64)
+        # Sort all parameters at once, and find where the cumulative weights reach
+        # the targets for both tails
+        i_sort = np.argsort(samples, axis=0)
+        cumsum = np.cumsum(weights[i_sort], axis=0)
+        targets = np.sum(weights) * np.array([limfrac, 1 - limfrac])
+        i_bounds = np.minimum(
+            [np.searchsorted(cumsum_i, targets) for cumsum_i in cumsum.T],
+            len(samples) - 1)
+        return np.take_along_axis(
+            samples, np.take_along_axis(i_sort, i_bounds.T, axis=0), axis=0).T
+
     def _drop_samples_null_weight(self):
         """Removes from the DataFrame all samples that have 0 weight."""
         self._data = self.data[self._data.weight > 0].reset_index(drop=True)
@@ -1027,7 +1100,8 @@ class SampleCollection(BaseCollection):
             minuslogposts = self.data[OutPar.minuslogpost].to_numpy(
                 dtype=np.float64)[first:last]
         # No logging of warnings temporarily, so getdist won't complain unnecessarily
-        with NoLogging():
+        # (getdist logs to the root logger, so leave the rest of the loggers alone)
+        with NoLogging(logger=logging.getLogger()):
             mcsamples = MCSamples(
                 samples=self.data[names].to_numpy(dtype=np.float64)[first:last],
                 weights=weights, loglikes=minuslogposts, names=names,
@@ -15,6 +15,7 @@ import traceback
 from copy import deepcopy
 import functools
 from random import shuffle, choice
+from typing import Optional
 
 # Local
 from cobaya import mpi
@@ -141,16 +142,33 @@ def abstract(method):
 
 
 class NoLogging:
-    def __init__(self, level=logging.WARNING):
+    """
+    Context manager that suppresses log messages of severity ``level`` and below.
+
+    If a ``logger`` is given, only the messages logged directly to it are suppressed
+    (using a filter), instead of disabling logging globally.
+    """
+
+    def __init__(self, level=logging.WARNING, logger: Optional[logging.Logger] = None):
         self._level = level
+        self._logger = logger
+
+    def _filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > self._level
 
     def __enter__(self):
         if self._level:
-            logging.disable(self._level)
+            if self._logger is None:
+                logging.disable(self._level)
+            else:
+                self._logger.addFilter(self._filter)
 
     def __exit__(self, exit_type, exit_value, exit_traceback):
         if self._level:
-            logging.disable(logging.NOTSET)
+            if self._logger is None:
+                logging.disable(logging.NOTSET)
+            else:
+                self._logger.removeFilter(self._filter)
 
 
 def exception_handler(exception_type, exception_instance, trace_back):
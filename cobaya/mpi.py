@@ -171,6 +171,17 @@ def allgather(data) -> list:
         return [data]
 
 
+def sendrecv(data, partner: int):
+    """
+    Sends ``data`` to the process with rank ``partner``, and returns the data received
+    from it.
+    """
+    if get_mpi_size() > 1:
+        return get_mpi_comm().sendrecv(data, dest=partner, source=partner)
+    else:
+        return data
+
+
 def zip_gather(list_of_data, root=0) -> Iterable[tuple]:
     """
     Takes a list of items and returns an iterable of lists of items from each process
@@ -187,6 +198,29 @@ def array_gather(list_of_data, root=0) -> List[np.ndarray]:
     return [np.array(i) for i in zip_gather(list_of_data, root=root)]
 
 
+def gather_floats(data, root=0, out: Optional[np.ndarray] = None
+                  ) -> Optional[np.ndarray]:
+    """
+    Gathers 1d float arrays of the same length from all processes, using the MPI buffer
+    interface (no pickling), and returns them as rows of a 2d array at the ``root``
+    process (``None`` for the rest).
+
+    If given, ``out`` is used as receive buffer at the ``root`` process (it must be a
+    contiguous float array of shape ``(number of processes, len(data))``).
+    """
+    data = np.ascontiguousarray(data, dtype=np.float64)
+    if get_mpi_size() > 1:
+        comm = get_mpi_comm()
+        if get_mpi_rank() == root:
+            recv = np.empty((get_mpi_size(), len(data))) if out is None else out
+        else:
+            recv = None
+        comm.Gather(data, recv, root=root)
+        return recv
+    else:
+        return data[None, :]
+
+
 # set if being run from pytest
 capture_manager: Any = None
 
@@ -423,6 +457,15 @@ class ProcessState:
             self.states[:] = State.NONE
         return all_ready
 
+    def wait_all_ready(self, sleep_interval: Optional[float] = None):
+        """
+        Sets this process in READY state and waits until all processes are too (raises
+        error if any other process is in error state).
+        """
+        self.set(State.READY)
+        while not self.all_ready():
+            time.sleep(self.sleep_interval if sleep_interval is None else sleep_interval)
+
     def __enter__(self):
         if more_than_one_process():
             self.tag = share(self.tag)
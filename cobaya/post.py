@@ -620,7 +620,7 @@ def post(info_or_yaml_or_file: Union[InputDict, str, os.PathLike],
                     last_dump_time = time.time()
 
             if weight > 0:
-                collection_out.add(sampled, derived=derived.values(), weight=weight,
+                collection_out.add(sampled, derived=list(derived.values()), weight=weight,
                                    logpriors=logpriors_new, loglikes=loglikes_new)
 
             # Display progress
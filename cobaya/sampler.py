@@ -46,7 +46,7 @@ implement only the methods ``initialize``, ``_run``, and ``products``.
 # Global
 import os
 from itertools import chain
-from typing import Optional, Sequence, Mapping, Union, Dict, TYPE_CHECKING
+from typing import Optional, Sequence, Mapping, Union, Dict, List, TYPE_CHECKING
 import numpy as np
 from numpy.random import SeedSequence, default_rng
 
@@ -533,12 +533,12 @@ class CovmatSampler(Sampler):
                     self.log,
                     f"The covariance matrix {from_msg} is not a symmetric square matrix.")
             # Fill with parameters in the loaded covmat
-            renames = {p: [p] + str_to_list(v.get("renames") or [])
-                       for p, v in params_infos.items()}
+            params_indices: Dict[str, List[int]] = {}
+            for i, (p, v) in enumerate(params_infos.items()):
+                for alias in dict.fromkeys([p] + str_to_list(v.get("renames") or [])):
+                    params_indices.setdefault(alias, []).append(i)
             indices_used, indices_sampler = zip(*[
-                [loaded_params.index(p),
-                 [list(params_infos).index(q) for q, a in renames.items() if p in a]]
-                for p in loaded_params])
+                [i, params_indices.get(p, [])] for i, p in enumerate(loaded_params)])
             if not any(indices_sampler):
                 raise LoggedError(
                     self.log,
@@ -572,16 +572,18 @@ class CovmatSampler(Sampler):
         # Fill gaps with "proposal" property, if present, otherwise ref (or prior)
         where_nan = np.isnan(covmat.diagonal())
         if np.any(where_nan):
-            covmat[where_nan, where_nan] = np.array(
+            proposal_variances = np.array(
                 [(info.get("proposal", np.nan) or np.nan) ** 2
-                 for info in params_infos.values()])[where_nan]
-        where_nan2 = np.isnan(covmat.diagonal())
-        if np.any(where_nan2):
-            # the variances are likely too large for a good proposal, e.g. conditional
-            # widths may be much smaller than the marginalized ones.
-            # Divide by 4, better to be too small than too large.
-            covmat[where_nan2, where_nan2] = (self.model.prior.reference_variances()
-                                              [where_nan2] / self.fallback_covmat_scale)
+                 for info in params_infos.values()])
+            covmat[where_nan, where_nan] = proposal_variances[where_nan]
+            where_nan2 = where_nan & np.isnan(proposal_variances)
+            if np.any(where_nan2):
+                # the variances are likely too large for a good proposal, e.g.
+                # conditional widths may be much smaller than the marginalized ones.
+                # Divide by 4, better to be too small than too large.
+                covmat[where_nan2, where_nan2] = (
+                        self.model.prior.reference_variances()[where_nan2] /
+                        self.fallback_covmat_scale)
         assert not np.any(np.isnan(covmat))
         return covmat, where_nan
 
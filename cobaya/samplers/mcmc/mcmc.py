@@ -12,6 +12,7 @@ from itertools import chain
 from typing import Sequence, Optional, Callable, Union, TYPE_CHECKING
 import numpy as np
 from pandas import DataFrame
+from scipy.linalg import eigh
 
 # Local
 from cobaya.sampler import CovmatSampler
@@ -47,10 +48,13 @@ class MCMC(CovmatSampler):
         "burn_in", "callback_function", "callback_every", "max_tries", "output_every",
         "learn_every", "learn_proposal_Rminus1_max", "learn_proposal_Rminus1_max_early",
         "learn_proposal_Rminus1_min", "max_samples", "Rminus1_stop", "Rminus1_cl_stop",
-        "Rminus1_cl_level", "covmat", "covmat_params"]
+        "Rminus1_cl_level", "covmat", "covmat_params", "parallel_tempering_ratio",
+        "parallel_tempering_swap_every"]
     _at_resume_prefer_old = CovmatSampler._at_resume_prefer_old + [
         "proposal_scale", "blocking"]
     _prior_rejections: int = 0
+    # Number of random variates drawn at once for the acceptance tests
+    _random_pool_size: int = 1000
     file_base_name = 'mcmc'
 
     # instance variables from yaml
@@ -59,6 +63,9 @@ class MCMC(CovmatSampler):
     output_every: NumberWithUnits
     callback_every: NumberWithUnits
     temperature: float
+    parallel_tempering: bool
+    parallel_tempering_ratio: float
+    parallel_tempering_swap_every: NumberWithUnits
     max_tries: NumberWithUnits
     max_samples: int
     drag: bool
@@ -93,10 +100,16 @@ class MCMC(CovmatSampler):
         if not self.model.prior.d():
             raise LoggedError(self.log, "No parameters being varied for sampler")
         self.log.debug("Initializing")
+        # Cached, to skip debug calls in the dragging loop
+        self._is_debug = self.is_debug()
         if self.callback_every is None:
             self.callback_every = self.learn_every
+        self._exponential_pool = iter(())
+        # Receive buffer for the convergence statistics, allocated at the first check
+        self._convergence_buffer: Optional[np.ndarray] = None
         self._quants_d_units = []
-        for q in ["max_tries", "learn_every", "callback_every", "burn_in"]:
+        for q in ["max_tries", "learn_every", "callback_every", "burn_in",
+                  "parallel_tempering_swap_every"]:
             number = NumberWithUnits(getattr(self, q), "d", dtype=int)
             self._quants_d_units.append(number)
             setattr(self, q, number)
@@ -105,6 +118,25 @@ class MCMC(CovmatSampler):
             self.temperature = 1
         elif self.temperature < 1:
             self.mpi_warning("Sampling temperatures <1 can lead to innacurate inference.")
+        if self.parallel_tempering:
+            if not more_than_one_process():
+                self.mpi_warning(
+                    "Parallel tempering disabled: needs more than one chain.")
+                self.parallel_tempering = False
+            elif not self.parallel_tempering_ratio > 1:
+                raise LoggedError(
+                    self.log, "The ratio between temperatures for parallel tempering "
+                              "must be larger than 1. Got %r.",
+                    self.parallel_tempering_ratio)
+            else:
+                self._cold_temperature = self.temperature
+                self.temperature = \
+                    self._cold_temperature * self.parallel_tempering_ratio ** mpi.rank()
+                self._swap_round = 0
+                self._cold_ready = False
+                self._cold_max_samples = False
+                self.log.info("Parallel tempering: sampling at temperature %g.",
+                              self.temperature)
         if is_main_process():
             if self.output.is_resuming() and (
                     max(self.mpi_size or 0, 1) != mpi.size()):
@@ -115,8 +147,12 @@ class MCMC(CovmatSampler):
         sync_processes()
         # One collection per MPI process: `name` is the MPI rank + 1
         name = str(1 + mpi.rank())
+        # When tempering in parallel, only the chain at the original temperature is saved
+        collection_output = (None if self.parallel_tempering and not is_main_process()
+                             else self.output)
         self.collection = SampleCollection(
-            self.model, self.output, name=name, resuming=self.output.is_resuming(),
+            self.model, collection_output, name=name,
+            resuming=bool(collection_output) and self.output.is_resuming(),
             temperature=self.temperature, sample_type="mcmc",
             is_batch=more_than_one_process())
         self.current_point = OneSamplePoint(self.model)
@@ -191,7 +227,8 @@ class MCMC(CovmatSampler):
         self.set_proposer_initial_covmat(load=True)
         # sanity check whether initial dispersion of points is plausible given the
         # covariance being used
-        if not self.output.is_resuming() and more_than_one_process():
+        if not self.output.is_resuming() and more_than_one_process() and \
+                not self.parallel_tempering:
             initial_mean = np.mean(np.array(mpi.allgather(initial_point)), axis=0)
             delta = initial_point - initial_mean
             diag, rot = np.linalg.eigh(self.proposer.get_covariance())
@@ -237,7 +274,7 @@ class MCMC(CovmatSampler):
     @property
     def n_slow(self):
         """Number of parameters which are considered slow, in binary fast/slow splits."""
-        return len(self.slow_params)
+        return sum(len(b) for b in self.slow_blocks)
 
     @property
     def fast_blocks(self):
@@ -252,7 +289,7 @@ class MCMC(CovmatSampler):
     @property
     def n_fast(self):
         """Number of parameters which are considered fast, in binary fast/slow splits."""
-        return len(self.fast_params)
+        return sum(len(b) for b in self.fast_blocks)
 
     def get_acceptance_rate(self, first=0, last=None):
         """
@@ -319,8 +356,9 @@ class MCMC(CovmatSampler):
                 )
         # Save blocking in updated info, in case we want to resume
         self._updated_info["blocking"] = list(zip(self.oversampling_factors, self.blocks))
-        sampled_params_list = list(self.model.parameterization.sampled_params())
-        blocks_indices = [[sampled_params_list.index(p) for p in b] for b in self.blocks]
+        sampled_params_indices = {
+            p: i for i, p in enumerate(self.model.parameterization.sampled_params())}
+        blocks_indices = [[sampled_params_indices[p] for p in b] for b in self.blocks]
         self.proposer = BlockedProposer(
             blocks_indices, self._rng,
             oversampling_factors=self.oversampling_factors,
@@ -382,10 +420,34 @@ class MCMC(CovmatSampler):
         last_output: float = 0
         last_n = self.n()
         state_check_every = 1
+        # When tempering in parallel, all chains stop together, after a swap step
+        max_samples = np.inf if self.parallel_tempering else self.max_samples
+        swap_every = (self.parallel_tempering_swap_every.value
+                      if self.parallel_tempering else None)
+        swap_next = False
         with mpi.ProcessState(self) as state:
-            while last_n < self.max_samples and not self.converged:
-                self.get_new_sample()
-                self.n_steps_raw += 1
+            while last_n < max_samples and not self.converged:
+                if swap_next:
+                    # Swap proposal, after every `swap_every` regular steps.
+                    # All chains must be here before the collective calls: wait for
+                    # them (and fail cleanly if any other one has failed)
+                    # (short polling interval: chains arrive together, all take the
+                    # same number of regular steps)
+                    swap_next = False
+                    state.wait_all_ready(sleep_interval=1e-5)
+                    self.get_new_sample_swap()
+                    if self._cold_ready:
+                        self._cold_ready = False
+                        state.wait_all_ready()
+                        self.check_convergence_and_learn_proposal()
+                        self.i_learn += 1
+                    if self._cold_max_samples:
+                        last_n = self.max_samples
+                        break
+                else:
+                    self.get_new_sample()
+                    self.n_steps_raw += 1
+                    swap_next = bool(swap_every) and not self.n_steps_raw % swap_every
                 if self.output_every.unit:
                     # if output_every in sec, print some info
                     # and dump at fixed time intervals
@@ -403,12 +465,17 @@ class MCMC(CovmatSampler):
                         # and actually added
                         last_n = n
                         if (self.callback_function and
-                                not (max(n, 1) % self.callback_every.value) and
-                                self.current_point.weight == 1):
+                                not (max(n, 1) % self.callback_every.value)):
                             self.callback_function_callable(self)
                             self.last_point_callback = len(self.collection)
 
-                        if more_than_one_process():
+                        if self.parallel_tempering:
+                            # Convergence checked on the chain at the original
+                            # temperature only, at the next swap step
+                            if is_main_process() and self.check_ready():
+                                self.log.info(self._msg_ready)
+                                self._cold_ready = True
+                        elif more_than_one_process():
                             # Checking convergence and (optionally) learning
                             # the covmat of the proposal
                             if self.check_ready() and state.set(mpi.State.READY):
@@ -435,7 +502,8 @@ class MCMC(CovmatSampler):
             # Write the last batch of samples ( < output_every (not in sec))
             self.collection.out_update()
 
-        ns = mpi.gather(self.n())
+        # When tempering in parallel, only the chain at the original temperature counts
+        ns = [self.n()] if self.parallel_tempering else mpi.gather(self.n())
         self.mpi_info("Sampling complete after %d accepted steps.", sum(ns))
 
     def n(self, burn_in=False):
@@ -485,7 +553,8 @@ class MCMC(CovmatSampler):
         current_start_logpost = self.current_point.logpost
         current_end_point = current_start_point.copy()
         self.proposer.get_proposal_slow(current_end_point)
-        self.log.debug("Proposed slow end-point: %r", current_end_point)
+        if self._is_debug:
+            self.log.debug("Proposed slow end-point: %r", current_end_point)
         # Save derived parameters of delta_slow jump, in case I reject all the dragging
         # steps but accept the move in the slow direction only
         current_end = self.model.logposterior(current_end_point)
@@ -501,19 +570,24 @@ class MCMC(CovmatSampler):
 
         # alloc mem
         delta_fast = np.empty(len(current_start_point))
+        # inverse number of interpolation points, for the fractions and the averages
+        inv_n_average = 1 / (1 + self.drag_interp_steps)
         # start dragging
         for i_step in range(1, 1 + self.drag_interp_steps):
-            self.log.debug("Dragging step: %d", i_step)
+            if self._is_debug:
+                self.log.debug("Dragging step: %d", i_step)
             # take a step in the fast direction in both slow extremes
-            delta_fast[:] = 0.
+            delta_fast.fill(0.)
             self.proposer.get_proposal_fast(delta_fast)
-            self.log.debug("Proposed fast step delta: %r", delta_fast)
+            if self._is_debug:
+                self.log.debug("Proposed fast step delta: %r", delta_fast)
             proposal_start_point = current_start_point + delta_fast
             # get the new extremes for the interpolated probability
             # (reject if any of them = -inf; avoid evaluating both if just one fails)
             # Force the computation of the (slow blocks) derived params at the starting
             # point, but discard them, since they contain the starting point's fast ones,
             # not used later -- save the end point's ones.
+            accept_drag = False
             proposal_start_logpost = self.model.logposterior(
                 proposal_start_point, return_derived=bool(derived),
                 _no_check=True).logpost
@@ -523,7 +597,7 @@ class MCMC(CovmatSampler):
                     proposal_end_point, return_derived=bool(derived), _no_check=True)
                 if proposal_end.logpost != -np.inf:
                     # create the interpolated probability and do a Metropolis test
-                    frac = i_step / (1 + self.drag_interp_steps)
+                    frac = i_step * inv_n_average
                     proposal_interp_logpost = ((1 - frac) * proposal_start_logpost +
                                                frac * proposal_end.logpost)
                     current_interp_logpost = ((1 - frac) * current_start_logpost +
@@ -536,26 +610,65 @@ class MCMC(CovmatSampler):
                         current_start_logpost = proposal_start_logpost
                         current_end_point = proposal_end_point
                         current_end = proposal_end
-                else:
-                    accept_drag = False
-            else:
-                accept_drag = False
-            self.log.debug("Dragging step: %s",
-                           ("accepted" if accept_drag else "rejected"))
+            if self._is_debug:
+                self.log.debug("Dragging step: %s",
+                               ("accepted" if accept_drag else "rejected"))
 
             # In any case, update the dragging probability for the final metropolis test
             start_drag_logpost_acc += current_start_logpost
             end_drag_logpost_acc += current_end.logpost
         # Test for the TOTAL step
-        n_average = 1 + self.drag_interp_steps
-        accept = self.metropolis_accept(end_drag_logpost_acc / n_average,
-                                        start_drag_logpost_acc / n_average)
+        accept = self.metropolis_accept(end_drag_logpost_acc * inv_n_average,
+                                        start_drag_logpost_acc * inv_n_average)
         if accept and not derived:
             # recompute with derived parameters (slow parameter ones should be cached)
             current_end = self.model.logposterior(current_end_point)
 
         self.process_accept_or_reject(accept, current_end_point, current_end)
-        self.log.debug("TOTAL step: %s", ("accepted" if accept else "rejected"))
+        if self._is_debug:
+            self.log.debug("TOTAL step: %s", ("accepted" if accept else "rejected"))
+        return accept
+
+    def get_new_sample_swap(self):
+        """
+        Parallel tempering step: proposes to swap the current state with that of the
+        chain at the adjacent temperature, alternating between swapping with the chain
+        above and below. It must be called simultaneously by all chains.
+
+        If the swap is accepted, it saves the old point into the collection and sets the
+        one of the other chain as the current state; if it is rejected (or there is no
+        chain to swap with) increases the weight of the current state by 1.
+
+        Returns
+        -------
+        ``True`` for an accepted swap, ``False`` for a rejected one.
+        """
+        rank = mpi.rank()
+        partner = rank + (1 if (rank + self._swap_round) % 2 == 0 else -1)
+        self._swap_round += 1
+        logposts, temperatures, randoms = zip(*mpi.allgather(
+            (self.current_point.logpost, self.temperature,
+             self._standard_exponential())))
+        # The chain at the original temperature also decides when to check convergence
+        self._cold_ready, self._cold_max_samples = mpi.share(
+            (self._cold_ready, self.n() >= self.max_samples))
+        has_partner = 0 <= partner < mpi.size()
+        if has_partner:
+            # Both chains take the random number of the lower-rank one -> same decision
+            log_ratio = ((1 / temperatures[rank] - 1 / temperatures[partner]) *
+                         (logposts[partner] - logposts[rank]))
+            accept = log_ratio >= 0 or randoms[min(rank, partner)] > -log_ratio
+        else:
+            accept = False
+        if accept:
+            trial, trial_results = mpi.sendrecv(
+                (self.current_point.values, self.current_point.results), partner)
+        else:
+            trial, trial_results = self.current_point.values, self.current_point.results
+        self.process_accept_or_reject(accept, trial, trial_results)
+        if has_partner:
+            self.log.debug("Swap with chain %d: %s", partner + 1,
+                           ("accepted" if accept else "rejected"))
         return accept
 
     def metropolis_accept(self, logp_trial, logp_current):
@@ -571,7 +684,19 @@ class MCMC(CovmatSampler):
         if logp_trial > logp_current:
             return True
         posterior_ratio = (logp_current - logp_trial) / self.temperature
-        return self._rng.standard_exponential() > posterior_ratio
+        return self._standard_exponential() > posterior_ratio
+
+    def _standard_exponential(self) -> float:
+        """
+        Returns a standard exponential variate, taken from a pool that is refilled from
+        the sampler's random generator when exhausted.
+        """
+        try:
+            return next(self._exponential_pool)
+        except StopIteration:
+            self._exponential_pool = iter(
+                self._rng.standard_exponential(self._random_pool_size).tolist())
+            return next(self._exponential_pool)
 
     def process_accept_or_reject(self, accept_state: bool, trial: np.ndarray,
                                  trial_results: LogPosterior):
@@ -659,38 +784,50 @@ class MCMC(CovmatSampler):
         """
         # Compute Rminus1 of means
         self.been_waiting = 0
-        if more_than_one_process():
+        # When tempering in parallel, only the chain at the original temperature is used
+        multiple_chains = more_than_one_process() and not self.parallel_tempering
+        is_main = is_main_process()
+        if multiple_chains:
             # Compute and gather means and covs
             use_first = int(self.n() / 2)
-            mean = self.collection.mean(first=use_first, tempered=True)
-            cov = self.collection.cov(first=use_first, tempered=True)
+            mean, cov = self.collection.mean_and_cov(first=use_first, tempered=True)
             acceptance_rate = self.get_acceptance_rate(use_first)
-            Ns, means, covs, acceptance_rates = mpi.array_gather(
-                [self.n(), mean, cov, acceptance_rate])
+            # Packed into a single message
+            packed = np.concatenate([[self.n(), acceptance_rate], mean, cov.ravel()])
+            if is_main and self._convergence_buffer is None:
+                self._convergence_buffer = np.empty((mpi.size(), len(packed)))
+            gathered = mpi.gather_floats(packed, out=self._convergence_buffer)
+            if is_main:
+                dim = len(mean)
+                Ns = gathered[:, 0].astype(int)
+                acceptance_rates = gathered[:, 1]
+                means = gathered[:, 2:2 + dim]
+                covs = gathered[:, 2 + dim:].reshape(-1, dim, dim)
         else:
             # Compute and gather means, covs and CL intervals of last m-1 chain fractions
             m = 1 + self.Rminus1_single_split
             cut = int(len(self.collection) / m)
-            try:
-                acceptance_rate = self.get_acceptance_rate(cut)
-                Ns = np.ones(m - 1) * cut
-                ranges = [(i * cut, (i + 1) * cut - 1) for i in range(1, m)]
-                means = np.array(
-                    [self.collection.mean(
-                        first=f, last=l, tempered=True)
-                        for f, l in ranges])
-                covs = np.array(
-                    [self.collection.cov(
-                        first=f, last=l, tempered=True)
-                        for f, l in ranges])
-            except always_stop_exceptions:
-                raise
-            except Exception:  # pylint: disable=broad-except
-                self.log.info("Not enough points in chain to check convergence. "
+            enough_points = False
+            # (each fraction contains cut - 1 samples)
+            if is_main and cut > 1:
+                try:
+                    acceptance_rate = self.get_acceptance_rate(cut)
+                    Ns = np.ones(m - 1) * cut
+                    ranges = [(i * cut, (i + 1) * cut - 1) for i in range(1, m)]
+                    means, covs = (np.array(stats) for stats in zip(*(
+                        self.collection.mean_and_cov(first=f, last=l, tempered=True)
+                        for f, l in ranges)))
+                    enough_points = True
+                except always_stop_exceptions:
+                    raise
+                except Exception:  # pylint: disable=broad-except
+                    pass
+            if not mpi.share(enough_points):
+                self.mpi_info("Not enough points in chain to check convergence. "
                               "Waiting for next checkpoint.")
                 return
             acceptance_rates = None
-        if is_main_process():
+        if is_main:
             self.progress.at[self.i_learn, "N"] = sum(Ns)
             self.progress.at[self.i_learn, "timestamp"] = \
                 datetime.datetime.now().isoformat()
@@ -713,7 +850,9 @@ class MCMC(CovmatSampler):
             # "Between" or "B" term
             # We don't weight with the number of samples in the chains here:
             # shorter chains will likely be outliers, and we want to notice them
-            cov_of_means = np.atleast_2d(np.cov(means.T))  # , fweights=Ns)
+            # (unbiased estimator, as np.cov, but without its generic-case overhead)
+            deltas_means = means - np.mean(means, axis=0)
+            cov_of_means = deltas_means.T.dot(deltas_means) / (len(means) - 1)
             # For numerical stability, we turn mean_of_covs into correlation matrix:
             #   rho = (diag(Sigma))^(-1/2) * Sigma * (diag(Sigma))^(-1/2)
             # and apply the same transformation to the mean of covs (same eigenvals!)
@@ -722,91 +861,71 @@ class MCMC(CovmatSampler):
             norm_mean_of_covs = (mean_of_covs / d).T / d
             success_means = False
             converged_means = False
-            # Cholesky of (normalized) mean of covs and eigvals of Linv*cov_of_means*L
+            Rminus1 = None
+            # Eigvals of Linv*cov_of_means*Linv^T, with L the Cholesky of the (normalized)
+            # mean of covs, as a generalized eigenproblem (fails if not pos. definite)
             try:
-                L = np.linalg.cholesky(norm_mean_of_covs)
-            except np.linalg.LinAlgError:
+                eigvals = eigh(corr_of_means, norm_mean_of_covs, eigvals_only=True)
+                success_means = True
+            except (np.linalg.LinAlgError, ValueError):
                 self.log.warning(
-                    "Negative covariance eigenvectors. "
-                    "This may mean that the covariance of the samples does not "
-                    "contain enough information at this point. "
+                    "Negative covariance eigenvectors, or could not compute "
+                    "eigenvalues. This may mean that the covariance of the samples does "
+                    "not contain enough information at this point. "
                     "Skipping learning a new covmat for now.")
             else:
-                Linv = np.linalg.inv(L)
-                try:
-                    eigvals = np.linalg.eigvalsh(Linv.dot(corr_of_means).dot(Linv.T))
-                    success_means = True
-                except np.linalg.LinAlgError:
-                    self.log.warning("Could not compute eigenvalues. "
-                                     "Skipping learning a new covmat for now.")
-                else:
-                    Rminus1 = max(np.abs(eigvals))
-                    self.progress.at[self.i_learn, "Rminus1"] = Rminus1
-                    # For real square matrices, a possible def of the cond number is:
-                    condition_number = Rminus1 / min(np.abs(eigvals))
-                    self.log.debug(" - Condition number = %g", condition_number)
-                    self.log.debug(" - Eigenvalues = %r", eigvals)
-                    accpt_multi_str = \
-                        " = sum(%r)" % list(Ns) if more_than_one_process() else ""
-                    self.log.info(
-                        " - Convergence of means: R-1 = %f after %d accepted steps%s",
-                        Rminus1, sum(Ns), accpt_multi_str)
-                    # Have we converged in means?
-                    # (criterion must be fulfilled twice in a row)
-                    converged_means = max(Rminus1, self.Rminus1_last) < self.Rminus1_stop
+                Rminus1 = max(np.abs(eigvals))
+                self.progress.at[self.i_learn, "Rminus1"] = Rminus1
+                # For real square matrices, a possible def of the cond number is:
+                condition_number = Rminus1 / min(np.abs(eigvals))
+                self.log.debug(" - Condition number = %g", condition_number)
+                self.log.debug(" - Eigenvalues = %r", eigvals)
+                accpt_multi_str = \
+                    " = sum(%r)" % list(Ns) if multiple_chains else ""
+                self.log.info(
+                    " - Convergence of means: R-1 = %f after %d accepted steps%s",
+                    Rminus1, sum(Ns), accpt_multi_str)
+                # Have we converged in means?
+                # (criterion must be fulfilled twice in a row)
+                converged_means = max(Rminus1, self.Rminus1_last) < self.Rminus1_stop
         else:
             mean_of_covs = None
             success_means = None
             converged_means = False
             Rminus1 = None
-        success_means, converged_means = mpi.share((success_means, converged_means))
+        # Share with the other processes everything needed below, in a single message
+        success_means, converged_means, Rminus1, mean_of_covs = mpi.share(
+            (success_means, converged_means, Rminus1, mean_of_covs))
         # Check the convergence of the bounds of the confidence intervals
         # Same as R-1, but with the rms deviation from the mean bound
         # in units of the mean standard deviation of the chains
         if converged_means:
-            if more_than_one_process():
-                # pylint: disable=protected-access
-                # noinspection PyProtectedMember
-                mcsamples = self.collection._sampled_to_getdist(
-                    first=use_first, tempered=True)
+            limfrac = self.Rminus1_cl_level / 2.
+            if multiple_chains:
                 try:
-                    bound = np.array([[
-                        mcsamples.confidence(i, limfrac=self.Rminus1_cl_level / 2.,
-                                             upper=which)
-                        for i in range(self.model.prior.d())]
-                        for which in [False, True]]).T
+                    bound = self.collection.confidence_bounds(
+                        limfrac, first=use_first, tempered=True)
                     success_bounds = True
+                except always_stop_exceptions:
+                    raise
                 except Exception:  # pylint: disable=broad-except
                     bound = None
                     success_bounds = False
                 bounds = np.array(mpi.gather(bound))
-            else:
+            elif is_main:
                 try:
-                    mcsamples_list = [
-                        # noinspection PyProtectedMember
-                        self.collection._sampled_to_getdist(
-                            first=i * cut, last=(i + 1) * cut - 1, tempered=True
-                        )  # pylint: disable=protected-access
+                    bounds = [
+                        self.collection.confidence_bounds(
+                            limfrac, first=i * cut, last=(i + 1) * cut - 1,
+                            tempered=True)
                         for i in range(1, m)]
+                    success_bounds = True
                 except always_stop_exceptions:
                     raise
-                except Exception:  # pylint: disable=broad-except
-                    self.log.info("Not enough points in chain to check c.l. convergence. "
-                                  "Waiting for next checkpoint.")
-                    return
-                try:
-                    bounds = [
-                        np.array(
-                            [[mcs.confidence(
-                                i, limfrac=self.Rminus1_cl_level / 2., upper=which)
-                                for i in range(self.model.prior.d())]
-                                for which in [False, True]]).T
-                        for mcs in mcsamples_list]
-                    success_bounds = True
                 except Exception:  # pylint: disable=broad-except
                     bounds = None
                     success_bounds = False
-            if is_main_process():
+            if is_main:
                 if success_bounds:
                     Rminus1_cl = (np.std(bounds, axis=0).T /
                                   np.sqrt(np.diag(mean_of_covs)))
@@ -814,11 +933,11 @@ class MCMC(CovmatSampler):
                     Rminus1_cl = np.max(Rminus1_cl)
                     self.progress.at[self.i_learn, "Rminus1_cl"] = Rminus1_cl
                     accpt_multi_str = \
-                        " = sum(%r)" % list(Ns) if more_than_one_process() else ""
+                        " = sum(%r)" % list(Ns) if multiple_chains else ""
                     self.log.info(
                         " - Convergence of bounds: R-1 = %f after %d accepted steps%s",
                         Rminus1_cl,
-                        sum(Ns) if more_than_one_process() else self.n(),
+                        sum(Ns) if multiple_chains else self.n(),
                         accpt_multi_str,
                     )
                     if Rminus1_cl < self.Rminus1_cl_stop:
@@ -828,10 +947,10 @@ class MCMC(CovmatSampler):
                 else:
                     self.log.info("Computation of the bounds was not possible. "
                                   "Waiting until the next converge check.")
-        # Broadcast and save the convergence status and the last R-1 of means
+            self.converged = mpi.share(self.converged)
+        # Save the convergence status and the last R-1 of means
         if success_means:
-            self.Rminus1_last, self.converged = mpi.share(
-                (Rminus1, self.converged) if is_main_process() else None)
+            self.Rminus1_last = Rminus1
             # Do we want to learn a better proposal pdf?
             if self.learn_proposal and not self.converged:
                 good_Rminus1 = (self.learn_proposal_Rminus1_max >
@@ -840,7 +959,11 @@ class MCMC(CovmatSampler):
                     self.mpi_info("Convergence less than requested for updates: "
                                   "waiting until the next convergence check.")
                     return
-                mean_of_covs = mpi.share(mean_of_covs)
+                if self.parallel_tempering:
+                    # Learnt at the original temperature: re-temper for this chain
+                    mean_of_covs = apply_temperature_cov(
+                        remove_temperature_cov(mean_of_covs, self._cold_temperature),
+                        self.temperature)
                 try:
                     self.proposer.set_covariance(mean_of_covs)  # is already tempered
                     self.mpi_info(" - Updated covariance matrix of proposal pdf.")
@@ -934,7 +1057,12 @@ class MCMC(CovmatSampler):
                 "When combining chains, it is recommended to remove some "
                 "initial fraction, e.g. 'skip_samples=0.3'"
             )
-        collections = mpi.gather(collection)
+        if self.parallel_tempering:
+            # Only the chain at the original temperature (root) samples the posterior:
+            # no need to gather the rest
+            collections = [collection] if is_main_process() else []
+        else:
+            collections = mpi.gather(collection)
         if is_main_process():
             if to_getdist:
                 collection = collections[0].to_getdist(combine_with=collections[1:])
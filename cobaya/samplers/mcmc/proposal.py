@@ -269,8 +269,13 @@ class BlockedProposer(HasLogger):
                 self.log, "The covariance matrix does not have the correct dimension: "
                           "it's %d, but it should be %d.", propose_matrix.shape[0],
                 self.d())
-        if not (np.allclose(propose_matrix.T, propose_matrix) and
-                np.all(np.linalg.eigvals(propose_matrix) > 0)):
+        # Cholesky fails as soon as a non-positive pivot is found (cheaper than eigvals)
+        try:
+            np.linalg.cholesky(propose_matrix)
+            is_pos_def = True
+        except np.linalg.LinAlgError:
+            is_pos_def = False
+        if not (np.allclose(propose_matrix.T, propose_matrix) and is_pos_def):
             raise LoggedError(self.log, "The given covmat is not a positive-definite, "
                                         "symmetric square matrix.")
         self.propose_matrix = propose_matrix.copy()
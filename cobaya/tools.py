@@ -636,7 +636,7 @@ def choleskyL(M, return_scale_free=False):
     if return_scale_free:
         return std_diag, Lprime
     else:
-        return np.linalg.inv(std_diag).dot(Lprime)
+        return Lprime / np.diag(std_diag)[:, None]
 
 
 def cov_to_std_and_corr(cov):
@@ -644,10 +644,10 @@ def cov_to_std_and_corr(cov):
     Gets the standard deviations (as a diagonal matrix)
     and the correlation matrix of a covariance matrix.
     """
-    std_diag = np.diag(np.sqrt(np.diag(cov)))
-    invstd_diag = np.linalg.inv(std_diag)
-    corr = invstd_diag.dot(cov).dot(invstd_diag)
-    return std_diag, corr
+    std = np.sqrt(np.diag(cov))
+    # Rescale rows and columns directly, instead of multiplying by diagonal matrices
+    corr = (cov / std).T / std
+    return np.diag(std), corr
 
 
 def are_different_params_lists(list_A, list_B, name_A="A", name_B="B"):
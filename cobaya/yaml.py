@@ -19,6 +19,12 @@ from yaml.resolver import BaseResolver
 from yaml.constructor import ConstructorError
 from typing import Mapping, Optional, Any
 
+try:
+    # Faster, libyaml-based loader and dumper
+    from yaml import CLoader as _Loader, CDumper as _Dumper
+except ImportError:
+    from yaml import Loader as _Loader, Dumper as _Dumper  # type: ignore
+
 # Local
 from cobaya.tools import prepare_comment, recursive_update
 from cobaya.conventions import Extension
@@ -41,7 +47,7 @@ class OutputError(Exception):
 
 # Custom loader ##########################################################################
 
-class ScientificLoader(yaml.Loader):
+class ScientificLoader(_Loader):
     pass
 
 
@@ -146,7 +152,8 @@ def yaml_load(text_stream, file_name=None) -> InfoDict:
             signal_right = "    <---- "
             sep = "|"
             context = 4
-            lines = text_stream.split("\n")
+            # No need to split past the last line of context
+            lines = text_stream.split("\n", line + context)
             pre = ((("\n" + " " * len(signal) + sep).join(
                 [""] + lines[max(line - 1 - context, 0):line - 1]))) + "\n"
             errorline = (signal + sep + lines[line - 1] +
@@ -174,68 +181,79 @@ def yaml_load_file(file_name: Optional[str], yaml_text: Optional[str] = None) ->
     if yaml_text is None:
         assert file_name
         with open(file_name, "r", encoding="utf-8-sig") as file:
-            yaml_text = "".join(file.readlines())
+            yaml_text = file.read()
     return yaml_load(yaml_text, file_name=file_name)
 
 
 # Custom dumper ##########################################################################
 
-def yaml_dump(info: Mapping[str, Any], stream=None, **kwds):
-    """
-    Drop-in replacement for the yaml dumper with some tweaks:
+class CustomDumper(_Dumper):
+    pass
 
-    - Order is preserved in dictionaries and other mappings
-    - Tuples are dumped as lists
-    - Numpy arrays (``numpy.ndarray``) are dumped as lists
-    - Numpy scalars are dumped as numbers, preserving type
-    """
 
-    class CustomDumper(yaml.Dumper):
-        pass
+# Make sure dicts preserve order when dumped
+# (This is still needed even for CPython 3!)
+def _dict_representer(dumper, data):
+    return dumper.represent_mapping(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, data.items())
+
+
+CustomDumper.add_representer(dict, _dict_representer)
+CustomDumper.add_representer(Mapping, _dict_representer)
+
+
+# Dump tuples as yaml "sequences"
+def _tuple_representer(dumper, data):
+    return dumper.represent_sequence(
+        BaseResolver.DEFAULT_SEQUENCE_TAG, list(data))
+
 
-    # Make sure dicts preserve order when dumped
-    # (This is still needed even for CPython 3!)
-    def _dict_representer(dumper, data):
-        return dumper.represent_mapping(
-            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, data.items())
+CustomDumper.add_representer(tuple, _tuple_representer)
 
-    CustomDumper.add_representer(dict, _dict_representer)
-    CustomDumper.add_representer(Mapping, _dict_representer)
 
-    # Dump tuples as yaml "sequences"
-    def _tuple_representer(dumper, data):
-        return dumper.represent_sequence(
-            BaseResolver.DEFAULT_SEQUENCE_TAG, list(data))
+# Numpy arrays and numbers
+def _numpy_array_representer(dumper, data):
+    return dumper.represent_sequence(
+        BaseResolver.DEFAULT_SEQUENCE_TAG, data.tolist())
 
-    CustomDumper.add_representer(tuple, _tuple_representer)
 
-    # Numpy arrays and numbers
-    def _numpy_array_representer(dumper, data):
-        return dumper.represent_sequence(
-            BaseResolver.DEFAULT_SEQUENCE_TAG, data.tolist())
+CustomDumper.add_representer(np.ndarray, _numpy_array_representer)
 
-    CustomDumper.add_representer(np.ndarray, _numpy_array_representer)
 
-    def _numpy_int_representer(dumper, data):
-        return dumper.represent_int(data)
+def _numpy_int_representer(dumper, data):
+    return dumper.represent_int(data)
 
-    CustomDumper.add_representer(np.int64, _numpy_int_representer)
 
-    def _numpy_float_representer(dumper, data):
-        return dumper.represent_float(data)
+CustomDumper.add_representer(np.int64, _numpy_int_representer)
 
-    CustomDumper.add_representer(np.float64, _numpy_float_representer)
 
-    # Dummy representer that prints True for non-representable python objects
-    # (prints True instead of nothing because some functions try cast values to bool)
-    # noinspection PyUnusedLocal
-    def _null_representer(dumper, data):
-        return dumper.represent_scalar('tag:yaml.org,2002:bool', 'true')
+def _numpy_float_representer(dumper, data):
+    return dumper.represent_float(float(data))
 
-    CustomDumper.add_representer(type(lambda: None), _null_representer)
-    CustomDumper.add_multi_representer(object, _null_representer)
 
-    # Dump!
+CustomDumper.add_representer(np.float64, _numpy_float_representer)
+
+
+# Dummy representer that prints True for non-representable python objects
+# (prints True instead of nothing because some functions try cast values to bool)
+# noinspection PyUnusedLocal
+def _null_representer(dumper, data):
+    return dumper.represent_scalar('tag:yaml.org,2002:bool', 'true')
+
+
+CustomDumper.add_representer(type(lambda: None), _null_representer)
+CustomDumper.add_multi_representer(object, _null_representer)
+
+
+def yaml_dump(info: Mapping[str, Any], stream=None, **kwds):
+    """
+    Drop-in replacement for the yaml dumper with some tweaks:
+
+    - Order is preserved in dictionaries and other mappings
+    - Tuples are dumped as lists
+    - Numpy arrays (``numpy.ndarray``) are dumped as lists
+    - Numpy scalars are dumped as numbers, preserving type
+    """
     return yaml.dump(info, stream, CustomDumper, allow_unicode=True, **kwds)
 
 
@@ -0,0 +1,85 @@
+"""
+Tests some SampleCollection methods.
+"""
+
+import logging
+import numpy as np
+import pytest
+
+from cobaya.collection import SampleCollection
+from cobaya.conventions import OutPar
+from cobaya.log import LoggedError, NoLogging
+from cobaya.model import get_model
+
+info_gaussian = {
+    "likelihood": {"gaussian": "lambda a, b: -0.5 * (a ** 2 + (b - 1) ** 2)"},
+    "params": {"a": {"prior": {"min": -5, "max": 5}},
+               "b": {"prior": {"dist": "norm", "loc": 0, "scale": 3}},
+               "c": {"derived": "lambda a, b: a + b"}}}
+
+
+def test_collection_add_null_prior():
+    model = get_model(info_gaussian)
+    collection = SampleCollection(model)
+    # Outside the prior: likelihoods and derived params are not computed
+    logposterior = model.logposterior([10, 0])
+    assert not len(logposterior.loglikes)
+    collection.add([10, 0], logpost=logposterior)
+    row = collection.data.iloc[0]
+    assert row[OutPar.minuslogprior] == np.inf
+    assert np.isnan(row[collection.chi2_names[0]])
+    assert np.isnan(row["c"])
+    # Points inside the prior are still fully stored
+    logposterior = model.logposterior([1, 2])
+    collection.add([1, 2], logpost=logposterior)
+    row = collection.data.iloc[1]
+    assert np.isclose(row[collection.chi2_names[0]], -2 * logposterior.loglikes[0])
+    assert np.isclose(row["c"], 3)
+
+
+def _random_collection(model, n=200, temperature=None, seed=0):
+    """Weighted (and possibly tempered) collection of random points."""
+    rng = np.random.default_rng(seed)
+    collection = SampleCollection(model, temperature=temperature)
+    for point in rng.normal(scale=[1, 3], size=(n, 2)):
+        logposterior = model.logposterior(point)
+        collection.add(point, logpost=logposterior, weight=rng.integers(1, 5))
+    return collection
+
+
+def test_collection_confidence_bounds():
+    model = get_model(info_gaussian)
+    limfrac = 0.025
+    for temperature in [None, 2]:
+        collection = _random_collection(model, temperature=temperature)
+        for first, last in [(None, None), (20, None), (10, 150)]:
+            for tempered in ([False, True] if temperature else [False]):
+                bounds = collection.confidence_bounds(
+                    limfrac, first=first, last=last, tempered=tempered)
+                mcsamples = collection._sampled_to_getdist(
+                    first=first, last=last, tempered=tempered)
+                expected = [[mcsamples.confidence(i, limfrac, upper=upper)
+                             for upper in [False, True]] for i in range(2)]
+                assert np.allclose(bounds, expected)
+
+
+def test_collection_mean_and_cov():
+    model = get_model(info_gaussian)
+    collection = _random_collection(model, temperature=2)
+    first, last = 10, 150
+    custom_weights = np.random.default_rng(1).random(last - first)
+    for derived in [False, True]:
+        for tempered in [False, True]:
+            kwargs = {"derived": derived, "tempered": tempered}
+            mean, cov = collection.mean_and_cov(**kwargs)
+            assert np.allclose(mean, collection.mean(**kwargs))
+            assert np.allclose(cov, collection.cov(**kwargs))
+            kwargs.update({"first": first, "last": last})
+            mean, cov = collection.mean_and_cov(weights=custom_weights.copy(), **kwargs)
+            assert np.allclose(
+                mean, collection.mean(weights=custom_weights.copy(), **kwargs))
+            assert np.allclose(
+                cov, collection.cov(weights=custom_weights.copy(), **kwargs))
+    # Empty range
+    with NoLogging(logging.ERROR), pytest.raises(LoggedError):
+        collection.mean_and_cov(first=2, last=2)
@@ -189,6 +189,68 @@ def test_mcmc_sync():
         assert aborted
 
 
+@flaky(max_runs=max_runs, min_passes=1)
+@pytest.mark.mpionly
+@mpi.sync_errors
+def test_mcmc_parallel_tempering():
+    info: InputDict = yaml_load(yaml)
+    info["sampler"]["mcmc"] = {"parallel_tempering": True, "Rminus1_stop": 0.005}
+    updated_info, sampler = run(info)
+    assert np.isclose(sampler.temperature, 2 ** mpi.rank())
+    gdsample = sampler.samples(combined=True, skip_samples=0.3, to_getdist=True)
+    # Posterior of the gaussian likelihood, the normal prior on b and the cut on a
+    assert abs(gdsample.mean('a') - 0.21) < 0.03
+    assert abs(gdsample.mean('b')) < 0.03
+    assert abs(gdsample.std('a') - 0.301) < 0.03
+    assert abs(gdsample.std('b') - 0.408) < 0.03
+
+
+@flaky(max_runs=max_runs, min_passes=1)
+@pytest.mark.mpionly
+@mpi.sync_errors
+def test_mcmc_parallel_tempering_swap_every_step():
+    # With a single parameter, a swap is proposed after every Metropolis step
+    info: InputDict = {
+        "likelihood": {"gaussian": "lambda a: -0.5 * a ** 2"},
+        "params": {"a": {"prior": {"min": -5, "max": 5}, "ref": 1, "proposal": 0.5}},
+        "sampler": {"mcmc": {"parallel_tempering": True, "max_samples": 500,
+                             "learn_proposal": False, "measure_speeds": False,
+                             "Rminus1_stop": 0}}}
+    updated_info, sampler = run(info)
+    assert sampler.parallel_tempering_swap_every.value == 1
+    values = sampler.products()["sample"]["a"].to_numpy()
+    # Chains must move (not only exchange states)
+    assert len(np.unique(values)) > len(values) / 4
+    if mpi.rank() == 0:
+        assert abs(np.average(values)) < 0.3
+
+
+@pytest.mark.mpionly
+def test_mcmc_parallel_tempering_sync():
+    n_calls = 0
+
+    def gaussian(a):
+        nonlocal n_calls
+        n_calls += 1
+        if mpi.rank() == 1 and n_calls > 300:
+            raise ValueError("Expected test error")
+        return -0.5 * a ** 2
+
+    info: InputDict = {
+        "likelihood": {"gaussian": gaussian},
+        "params": {"a": {"prior": {"min": -5, "max": 5}, "proposal": 0.5}},
+        "sampler": {"mcmc": {"parallel_tempering": True, "measure_speeds": False,
+                             # swaps far apart: the error happens in between
+                             "parallel_tempering_swap_every": 100}}}
+    logger.info('Test error synchronization with parallel tempering')
+    if mpi.rank() == 1:
+        with NoLogging(logging.ERROR), pytest.raises(ValueError):
+            run(info, stop_at_error=True)
+    else:
+        with pytest.raises(mpi.OtherProcessError):
+            run(info, stop_at_error=True)
+
+
 @flaky(max_runs=max_runs, min_passes=1)
 def test_mcmc_blocking():
     info_mcmc = {"mcmc": {"burn_in": 0, "learn_proposal": False}}